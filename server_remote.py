@@ -5,26 +5,36 @@ Compliant with MCP Streamable HTTP specification
 """
 
 import os
+import sys
+import asyncio
+import hmac
 import logging
-import uuid
-from typing import Any, Optional
+import time
+from secrets import token_hex
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
 from datetime import datetime
 import httpx
+import ijson
+import msgspec
+from cachetools import TTLCache
 from mcp.server.models import InitializationOptions
 import mcp.types as types
 from mcp.server import NotificationOptions, Server
 from starlette.applications import Starlette
 from starlette.routing import Route
 from starlette.requests import Request
-from starlette.responses import Response, JSONResponse, StreamingResponse
+from starlette.responses import Response, StreamingResponse
 from starlette.middleware import Middleware
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 import uvicorn
-import json
+import orjson
 
-# Configure logging
+# Configure logging (WARNING by default; set LOG_LEVEL=INFO for per-request logs)
 logging.basicConfig(
-    level=logging.INFO,
+    level=os.getenv("LOG_LEVEL", "WARNING").upper(),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger("trustydata-mcp-remote")
@@ -34,68 +44,112 @@ API_BASE_URL = os.getenv("API_BASE_URL", "http://127.0.0.1:8080")
 TRUSTYDATA_API_KEY = os.getenv("TRUSTYDATA_API_KEY")
 SERVER_AUTH_TOKEN = os.getenv("SERVER_AUTH_TOKEN")  # For authenticating clients
 MCP_PROTOCOL_VERSION = "2025-06-18"
+DEBUG = os.getenv("DEBUG", "").lower() in ("1", "true", "yes")
+SESSION_TTL = int(os.getenv("SESSION_TTL", "3600"))  # Seconds of inactivity before eviction
+SESSION_REAP_INTERVAL = 60
+CACHE_TTL = int(os.getenv("CACHE_TTL", "300"))  # Seconds a formatted search result is reused
 
 if not TRUSTYDATA_API_KEY:
     logger.warning("TRUSTYDATA_API_KEY environment variable not set")
 
+# Expected Authorization header, compared in constant time
+_AUTH_ENABLED = bool(SERVER_AUTH_TOKEN)
+_EXPECTED_BEARER = f"Bearer {SERVER_AUTH_TOKEN}".encode() if _AUTH_ENABLED else None
+
 if not SERVER_AUTH_TOKEN:
     logger.warning("SERVER_AUTH_TOKEN not set - authentication disabled (NOT RECOMMENDED FOR PRODUCTION)")
 
+# Shared HTTP client for the TrustyData API: pooled keep-alive connections
+# avoid a fresh TCP/TLS handshake on every tool call. Closed on app shutdown.
+HTTP_CLIENT = httpx.AsyncClient(
+    base_url=API_BASE_URL,
+    headers={
+        "Authorization": f"Bearer {TRUSTYDATA_API_KEY}",
+        "Accept": "application/json",
+    },
+    limits=httpx.Limits(
+        max_connections=100,
+        max_keepalive_connections=20,
+        keepalive_expiry=15.0,
+    ),
+    timeout=30.0,
+)
+
+# Formatted search_localities results keyed on canonical query parameters.
+# Only successful API responses are stored.
+RESULT_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=CACHE_TTL)
+_cache_locks: dict[bytes, list] = {}  # key -> [lock, holders and waiters]
+_search_flights: dict[bytes, "SearchFlight"] = {}  # key -> upstream search being streamed
+
 # Session management
-sessions = {}  # session_id -> session_data
+sessions: dict[str, "Session"] = {}  # session_id -> session_data
 
 # Create MCP server instance
 mcp_server = Server("trustydata-mcp")
 
 
+class ORJSONResponse(Response):
+    """JSON response serialized with orjson instead of the stdlib encoder"""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
 class Session:
     """Manages MCP session state"""
     def __init__(self, session_id: str):
         self.session_id = session_id
-        self.created_at = datetime.now()
+        self.created_at = time.time()  # Formatted lazily in to_dict
+        self.last_used = time.monotonic()
         self.initialized = False
 
     def to_dict(self):
         return {
             "session_id": self.session_id,
-            "created_at": self.created_at.isoformat(),
+            "created_at": datetime.fromtimestamp(self.created_at).isoformat(),
             "initialized": self.initialized
         }
 
 
 def get_or_create_session(session_id: Optional[str] = None) -> Session:
     """Get existing session or create new one"""
-    if session_id and session_id in sessions:
-        return sessions[session_id]
+    session = sessions.get(session_id) if session_id else None
+    if session is not None:
+        session.last_used = time.monotonic()
+        return session
 
-    new_session_id = session_id or str(uuid.uuid4())
+    new_session_id = session_id or token_hex(16)
     session = Session(new_session_id)
     sessions[new_session_id] = session
-    logger.info(f"Created new session: {new_session_id}")
+    logger.info("Created new session: %s", new_session_id)
     return session
 
 
-async def verify_auth(request: Request) -> bool:
-    """Verify request authentication"""
-    if not SERVER_AUTH_TOKEN:
+async def reap_sessions():
+    """Periodically evict sessions idle for longer than SESSION_TTL"""
+    while True:
+        await asyncio.sleep(SESSION_REAP_INTERVAL)
+        now = time.monotonic()
+        expired = [k for k, v in sessions.items() if now - v.last_used > SESSION_TTL]
+        for session_id in expired:
+            sessions.pop(session_id, None)
+        if expired:
+            logger.info("Evicted %d expired session(s)", len(expired))
+
+
+def verify_auth(auth_header: Optional[bytes]) -> bool:
+    """Verify request authentication from the raw Authorization header"""
+    if not _AUTH_ENABLED:
         # Auth disabled for development
         return True
 
-    auth_header = request.headers.get("Authorization", "")
-    if not auth_header.startswith("Bearer "):
-        return False
-
-    token = auth_header[7:]  # Remove "Bearer " prefix
-    return token == SERVER_AUTH_TOKEN
+    return auth_header is not None and hmac.compare_digest(auth_header, _EXPECTED_BEARER)
 
 
-@mcp_server.list_tools()
-async def handle_list_tools() -> list[types.Tool]:
-    """List available tools."""
-    return [
-        types.Tool(
-            name="search_localities",
-            description="""Search for French localities (cities, towns, villages) with comprehensive filtering options and demographic data.
+SEARCH_LOCALITIES_TOOL = types.Tool(
+    name="search_localities",
+    description="""Search for French localities (cities, towns, villages) with comprehensive filtering options and demographic data.
 
 This tool combines data from La Poste, the French postal service, with official French administrative from INSEE.
 **Search Methods:**
@@ -126,66 +180,261 @@ This tool combines data from La Poste, the French postal service, with official
 - Build autocomplete systems for French addresses
 
 Returns up to 1000 results per query with official INSEE population census data.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "q": {
-                        "type": "string",
-                        "description": "Search query for locality name (e.g., 'Paris', 'Lyon', 'Marseille')",
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of results to return (default: 1000)",
-                        "default": 1000,
-                        "minimum": 1,
-                        "maximum": 1000,
-                    },
-                    "department_code": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Filter by department INSEE code(s) (e.g., ['75'] for Paris, ['13'] for Bouches-du-Rhône).",
-                    },
-                    "postal_code": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Filter by postal code(s) (e.g., ['75001'] for Paris 1er arrondissement). It can filter by multiple postal codes simultaneously (e.g., ['75001','62930'] for Paris 1er arrondissement and Wimereux).",
-                    },
-
-                    "department_name": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Filter by department name(s) (e.g., ['Paris', 'Rhône'])",
-                    },
-                    "region_code": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Filter by region INSEE code(s) (e.g., ['11'] for Île-de-France)",
-                    },
-                    "region_name": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Filter by region name(s) in UPPERCASE (e.g., ['BRETAGNE', 'OCCITANIE', 'ILE DE FRANCE'])",
-                    },
-                    "population_min": {
-                        "type": "integer",
-                        "description": "Minimum population threshold",
-                        "minimum": 0,
-                    },
-                    "population_max": {
-                        "type": "integer",
-                        "description": "Maximum population threshold",
-                        "minimum": 0,
-                    },
-                    "details": {
-                        "type": "boolean",
-                        "description": "Include detailed administrative information (default: true)",
-                        "default": True,
-                    },
-                },
-                "required": [],
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "q": {
+                "type": "string",
+                "description": "Search query for locality name (e.g., 'Paris', 'Lyon', 'Marseille')",
             },
-        )
+            "limit": {
+                "type": "integer",
+                "description": "Maximum number of results to return (default: 1000)",
+                "default": 1000,
+                "minimum": 1,
+                "maximum": 1000,
+            },
+            "department_code": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Filter by department INSEE code(s) (e.g., ['75'] for Paris, ['13'] for Bouches-du-Rhône).",
+            },
+            "postal_code": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Filter by postal code(s) (e.g., ['75001'] for Paris 1er arrondissement). It can filter by multiple postal codes simultaneously (e.g., ['75001','62930'] for Paris 1er arrondissement and Wimereux).",
+            },
+
+            "department_name": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Filter by department name(s) (e.g., ['Paris', 'Rhône'])",
+            },
+            "region_code": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Filter by region INSEE code(s) (e.g., ['11'] for Île-de-France)",
+            },
+            "region_name": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Filter by region name(s) in UPPERCASE (e.g., ['BRETAGNE', 'OCCITANIE', 'ILE DE FRANCE'])",
+            },
+            "population_min": {
+                "type": "integer",
+                "description": "Minimum population threshold",
+                "minimum": 0,
+            },
+            "population_max": {
+                "type": "integer",
+                "description": "Maximum population threshold",
+                "minimum": 0,
+            },
+            "details": {
+                "type": "boolean",
+                "description": "Include detailed administrative information (default: true)",
+                "default": True,
+            },
+            "raw_json": {
+                "type": "boolean",
+                "description": "Return the raw TrustyData API JSON response as an embedded resource instead of formatted text (default: false)",
+                "default": False,
+            },
+        },
+        "required": [],
+    },
+)
+
+# Serialized initialize result, identical for every client
+_INITIALIZE_RESULT = orjson.dumps({
+    "protocolVersion": MCP_PROTOCOL_VERSION,
+    "capabilities": {
+        "tools": {},
+    },
+    "serverInfo": {
+        "name": "trustydata-mcp",
+        "version": "1.0.0",
+        "icons": [
+            {
+                "src": "https://mcp.trustydata.app/favicon.ico",
+                "mimeType": "image/x-icon"
+            }
+        ]
+    }
+})
+
+# Serialized tools/list result, built once since the tool catalog is static
+_TOOLS_LIST_RESULT = orjson.dumps({
+    "tools": [
+        {"name": tool.name, "description": tool.description, "inputSchema": tool.inputSchema}
+        for tool in (SEARCH_LOCALITIES_TOOL,)
     ]
+})
+
+
+@mcp_server.list_tools()
+async def handle_list_tools() -> list[types.Tool]:
+    """List available tools."""
+    return [SEARCH_LOCALITIES_TOOL]
+
+
+# Fields that are only interpolated into the output are typed Any, so an
+# unexpected type from the API is printed as-is instead of failing the search
+class Population(msgspec.Struct):
+    """Census population figures for one period"""
+    totale: Any = None
+    municipale: Any = None
+    comptee_a_part: Any = None
+    periode: Any = "N/A"
+
+
+class Cog(msgspec.Struct):
+    """Official geographic code (COG) identifiers"""
+    insee: Any = None
+
+
+class Admin(msgspec.Struct):
+    """Department or region of a locality"""
+    libelle: Any = "N/A"
+    id: Any = "N/A"
+    population: list[Population] = []
+
+
+class Locality(msgspec.Struct):
+    """One locality returned by /locality/search"""
+    nom_commune: Any = "N/A"
+    cog: Cog | None = None
+    code_postal: Any = None
+    population: list[Population] = []
+    departement: Admin | None = None
+    region: Admin | None = None
+
+
+class SearchResponse(msgspec.Struct):
+    """Response body of /locality/search"""
+    status: str | None = "UNKNOWN"
+    message: Any = ""
+    count: int | None = 0
+    choices: list[Locality] = []
+
+
+# Decodes API responses straight into the structs above
+_SEARCH_DECODER = msgspec.json.Decoder(SearchResponse)
+
+
+def build_search_params(arguments: dict | None) -> dict:
+    """Build TrustyData API query parameters from tool arguments"""
+    params = {}
+    if arguments:
+        for key, value in arguments.items():
+            # raw_json selects the output format and is not an API parameter
+            if value is not None and key != "raw_json":
+                params[key] = value
+    return params
+
+
+def format_locality(idx: int, locality: Locality) -> str:
+    """Format a single locality entry, one detail per line"""
+    lines = [f"{idx}. **{locality.nom_commune}**"]
+
+    if locality.cog and locality.cog.insee:
+        lines.append(f"   - INSEE Code: {locality.cog.insee}")
+
+    if locality.code_postal:
+        lines.append(f"   - Postal Code: {locality.code_postal}")
+
+    for pop in locality.population:
+        lines.append(f"   - Population ville ({pop.periode}): totale={pop.totale}, municipale={pop.municipale}, comptée à part={pop.comptee_a_part}")
+
+    dept = locality.departement
+    if dept:
+        lines.append(f"   - Department: {dept.libelle} ({dept.id})")
+
+        for pop in dept.population:
+            lines.append(f"   - Population département ({pop.periode}): totale={pop.totale}, municipale={pop.municipale}, comptée à part={pop.comptee_a_part}")
+
+    region = locality.region
+    if region:
+        lines.append(f"   - Region: {region.libelle} ({region.id})")
+
+        for pop in region.population:
+            lines.append(f"   - Population région ({pop.periode}): totale={pop.totale}, municipale={pop.municipale}, comptée à part={pop.comptee_a_part}")
+
+    return "\n".join(lines)
+
+
+def format_header(count: int) -> str:
+    """Format the result summary line"""
+    return f"Found {count} localit{'y' if count == 1 else 'ies'}:"
+
+
+def format_no_results(status: str, message: str) -> str:
+    """Format the message returned when the search matched nothing"""
+    return f"Status: {status}\nMessage: {message}\nNo localities found matching your criteria."
+
+
+def format_results(status: str, count: int, message: Any, localities: list[Locality]) -> str:
+    """Format a complete search result, or the no-results message"""
+    if status != "OK" or count == 0:
+        return format_no_results(status, message)
+
+    # Accumulate parts and join once to stay linear in output size
+    parts = [format_header(count)]
+    for idx, locality in enumerate(localities, 1):
+        parts.append("\n\n")
+        parts.append(format_locality(idx, locality))
+    return "".join(parts)
+
+
+def format_search_error(e: Exception) -> str:
+    """Format a failed search as the tool result text, logging it"""
+    if isinstance(e, httpx.HTTPStatusError):
+        error_msg = f"API Error ({e.response.status_code}): {e.response.text}"
+    else:
+        error_msg = f"Error searching localities: {e}"
+    logger.error(error_msg)
+    return error_msg
+
+
+def cache_key(params: dict, raw_json: bool = False) -> bytes:
+    """Canonical cache key for a set of query parameters and output format"""
+    key = orjson.dumps(params, option=orjson.OPT_SORT_KEYS)
+    return b"raw:" + key if raw_json else key
+
+
+@asynccontextmanager
+async def singleflight(key: bytes):
+    """Serialize work on a cache key so concurrent misses hit the API only once"""
+    entry = _cache_locks.get(key)
+    if entry is None:
+        entry = _cache_locks[key] = [asyncio.Lock(), 0]
+    entry[1] += 1  # Holders and waiters; the lock is dropped once none are left
+    try:
+        async with entry[0]:
+            yield
+    finally:
+        entry[1] -= 1
+        if not entry[1] and _cache_locks.get(key) is entry:
+            del _cache_locks[key]
+
+
+async def search_localities_raw(params: dict) -> str:
+    """Query the TrustyData API and return its JSON body unparsed, raising on HTTP errors"""
+    logger.info("Searching localities (raw JSON) with params: %s", params)
+
+    response = await HTTP_CLIENT.get("/locality/search", params=params)
+    response.raise_for_status()
+    return response.text
+
+
+async def search_localities_text(params: dict) -> str:
+    """Query the TrustyData API and format the result, raising on HTTP errors"""
+    logger.info("Searching localities with params: %s", params)
+
+    response = await HTTP_CLIENT.get("/locality/search", params=params)
+    response.raise_for_status()
+    data = _SEARCH_DECODER.decode(response.content)
+    return format_results(data.status, data.count, data.message, data.choices)
 
 
 @mcp_server.call_tool()
@@ -206,105 +455,217 @@ async def handle_call_tool(
         ]
 
     # Build query parameters
-    params = {}
-    if arguments:
-        for key, value in arguments.items():
-            if value is not None:
-                params[key] = value
+    params = build_search_params(arguments)
 
-    # Make API request
+    # Serve repeated queries from the cache, fetching each key at most once
+    raw_json = bool(arguments and arguments.get("raw_json"))
+    key = cache_key(params, raw_json)
     try:
-        async with httpx.AsyncClient() as client:
-            headers = {
-                "Authorization": f"Bearer {TRUSTYDATA_API_KEY}",
-                "Accept": "application/json",
-            }
+        async with singleflight(key):
+            text = RESULT_CACHE.get(key)
+            if text is None:
+                if raw_json:
+                    text = await search_localities_raw(params)
+                else:
+                    text = await search_localities_text(params)
+                RESULT_CACHE[key] = text
+
+        if raw_json:
+            return [
+                types.EmbeddedResource(
+                    type="resource",
+                    resource=types.TextResourceContents(
+                        uri="trustydata://locality/search",
+                        mimeType="application/json",
+                        text=text,
+                    ),
+                )
+            ]
+
+        return [types.TextContent(type="text", text=text)]
 
-            logger.info(f"Searching localities with params: {params}")
+    except Exception as e:
+        return [types.TextContent(type="text", text=format_search_error(e))]
 
-            response = await client.get(
-                f"{API_BASE_URL}/locality/search",
-                headers=headers,
-                params=params,
-                timeout=30.0,
-            )
+
+class SearchFlight:
+    """
+    One upstream search being streamed, shared by every SSE response for its key.
+
+    The upstream response is fetched and formatted by a background task, so
+    it progresses at the API's pace, never at the pace of a client reading
+    its stream. Each response replays the fragments from the start and then
+    follows new ones as they arrive.
+    """
+    def __init__(self):
+        self.fragments: list[str] = []
+        self.done = False
+        self._changed = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+
+    def append(self, fragment: str):
+        self.fragments.append(fragment)
+        self._notify()
+
+    def finish(self):
+        self.done = True
+        self._notify()
+
+    def _notify(self):
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def replay(self) -> AsyncIterator[str]:
+        """Yield every fragment, waiting for new ones until the search is finished"""
+        idx = 0
+        while True:
+            while idx < len(self.fragments):
+                yield self.fragments[idx]
+                idx += 1
+            if self.done:
+                return
+            await self._changed.wait()
+
+
+async def run_search_flight(key: bytes, params: dict, flight: SearchFlight):
+    """
+    Fetch and format a search for a SearchFlight.
+
+    The upstream response is parsed incrementally and each batch of
+    localities is appended as soon as it has been received; localities
+    completed within the same upstream chunk are coalesced into one
+    fragment. The joined fragments equal search_localities_text's output
+    and are cached on success.
+    """
+    logger.info("Streaming localities with params: %s", params)
+
+    try:
+        async with HTTP_CLIENT.stream("GET", "/locality/search", params=params) as response:
+            if response.is_error:
+                await response.aread()
             response.raise_for_status()
-            data = response.json()
-
-            # Format response
-            status = data.get("status", "UNKNOWN")
-            message = data.get("message", "")
-            count = data.get("count", 0)
-            choices = data.get("choices", [])
-
-            if status != "OK" or count == 0:
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"Status: {status}\nMessage: {message}\nNo localities found matching your criteria.",
-                    )
-                ]
 
-            # Format results
-            result_text = f"Found {count} localit{'y' if count == 1 else 'ies'}:\n\n"
+            events = ijson.sendable_list()
+            parser = ijson.parse_coro(events, use_float=True)
+            meta = {}
+            builder = None
+            pending = []  # Localities parsed but not yet written
+            written = 0
+
+            async for chunk in response.aiter_bytes():
+                parser.send(chunk)
+                for prefix, event, value in events:
+                    if builder is not None:
+                        builder.event(event, value)
+                        if prefix == "choices.item" and event == "end_map":
+                            pending.append(msgspec.convert(builder.value, Locality))
+                            builder = None
+                    elif prefix == "choices.item" and event == "start_map":
+                        builder = ijson.ObjectBuilder()
+                        builder.event(event, value)
+                    elif prefix in ("status", "message", "count"):
+                        meta[prefix] = value
+                del events[:]
+
+                # Start writing once the upstream confirmed there are results
+                if not pending or meta.get("status") != "OK" or not meta.get("count"):
+                    continue
+                parts = [] if written else [format_header(meta["count"])]
+                for locality in pending:
+                    written += 1
+                    parts.append("\n\n")
+                    parts.append(format_locality(written, locality))
+                pending.clear()
+                flight.append("".join(parts))
+
+            parser.close()
+
+        if not written:
+            # The response ended before status and count confirmed results
+            flight.append(format_results(
+                meta.get("status", "UNKNOWN"), meta.get("count", 0), meta.get("message", ""), pending
+            ))
+
+        RESULT_CACHE[key] = "".join(flight.fragments)
+
+    except Exception as e:
+        flight.append(("\n\n" if flight.fragments else "") + format_search_error(e))
+    finally:
+        flight.finish()
+        if _search_flights.get(key) is flight:
+            del _search_flights[key]
+
 
-            for idx, locality in enumerate(choices, 1):
-                name = locality.get('nom_commune', 'N/A')
-                result_text += f"{idx}. **{name}**\n"
+async def stream_search_localities(request_id: Any, arguments: dict | None) -> AsyncIterator[bytes]:
+    """
+    Stream a search_localities tools/call result as a single SSE message.
+
+    The JSON-RPC envelope is sent immediately and the result text is written
+    as escaped fragments inside it as they are produced. Concurrent requests
+    for the same query share one upstream fetch (see SearchFlight). The
+    concatenated event is the same JSON-RPC response that handle_call_tool
+    would produce.
+    """
+    yield (
+        b'event: message\ndata: {"jsonrpc":"2.0","id":'
+        + orjson.dumps(request_id)
+        + b',"result":{"content":[{"type":"text","text":"'
+    )
+
+    params = build_search_params(arguments)
+    key = cache_key(params)
+
+    text = RESULT_CACHE.get(key)
+    if text is not None:
+        yield orjson.dumps(text)[1:-1]
+    else:
+        flight = _search_flights.get(key)
+        if flight is None:
+            flight = _search_flights[key] = SearchFlight()
+            flight.task = asyncio.create_task(run_search_flight(key, params, flight))
 
-                cog = locality.get("cog", {})
-                if cog.get("insee"):
-                    result_text += f"   - INSEE Code: {cog['insee']}\n"
+        async for fragment in flight.replay():
+            yield orjson.dumps(fragment)[1:-1]
 
-                if locality.get("code_postal"):
-                    result_text += f"   - Postal Code: {locality['code_postal']}\n"
+    yield b'"}]}}\n\n'
 
-                for population_data in locality.get("population", []):
-                    popt = population_data.get('totale')
-                    popm = population_data.get('municipale')
-                    popa = population_data.get('comptee_a_part')
-                    periode = population_data.get('periode', 'N/A')
-                    result_text += f"   - Population ville ({periode}): totale={popt}, municipale={popm}, comptée à part={popa}\n"
 
-                dept = locality.get("departement")
-                if dept:
-                    dept_name = dept.get('libelle', 'N/A')
-                    dept_code = dept.get('id', 'N/A')
-                    result_text += f"   - Department: {dept_name} ({dept_code})\n"
+class MCPRequestMiddleware:
+    """
+    Pure ASGI middleware for the /mcp endpoint, run once per request
+    before routing: verifies authentication, reads the MCP protocol
+    version and resolves the session into request.state
+    """
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-                    for population_data in dept.get("population", []):
-                        popt = population_data.get('totale')
-                        popm = population_data.get('municipale')
-                        popa = population_data.get('comptee_a_part')
-                        periode = population_data.get('periode', 'N/A')
-                        result_text += f"   - Population département ({periode}): totale={popt}, municipale={popm}, comptée à part={popa}\n"
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["path"] != "/mcp" or scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
 
-                region = locality.get("region")
-                if region:
-                    region_name = region.get('libelle', 'N/A')
-                    region_code = region.get('id', 'N/A')
-                    result_text += f"   - Region: {region_name} ({region_code})\n"
+        headers = dict(scope["headers"])
 
-                    for population_data in region.get("population", []):
-                        popt = population_data.get('totale')
-                        popm = population_data.get('municipale')
-                        popa = population_data.get('comptee_a_part')
-                        periode = population_data.get('periode', 'N/A')
-                        result_text += f"   - Population région ({periode}): totale={popt}, municipale={popm}, comptée à part={popa}\n"
+        # Verify authentication
+        if not verify_auth(headers.get(b"authorization")):
+            await Response("Unauthorized", status_code=401)(scope, receive, send)
+            return
 
+        state = scope.setdefault("state", {})
 
-                result_text += "\n"
+        # Verify MCP protocol version
+        protocol_version = headers.get(b"mcp-protocol-version", b"2025-03-26").decode("latin-1")
+        logger.info("MCP Protocol Version: %s", protocol_version)
+        state["protocol_version"] = protocol_version
 
-            return [types.TextContent(type="text", text=result_text.strip())]
+        # Get or create session (DELETE only looks sessions up)
+        if scope["method"] in ("GET", "POST"):
+            session_id = headers.get(b"mcp-session-id")
+            state["mcp_session"] = get_or_create_session(
+                session_id.decode("latin-1") if session_id else None
+            )
 
-    except httpx.HTTPStatusError as e:
-        error_msg = f"API Error ({e.response.status_code}): {e.response.text}"
-        logger.error(error_msg)
-        return [types.TextContent(type="text", text=error_msg)]
-    except Exception as e:
-        error_msg = f"Error searching localities: {str(e)}"
-        logger.error(error_msg)
-        return [types.TextContent(type="text", text=error_msg)]
+        await self.app(scope, receive, send)
 
 
 async def handle_mcp_endpoint(request: Request):
@@ -312,26 +673,88 @@ async def handle_mcp_endpoint(request: Request):
     Main MCP endpoint - handles both POST and GET according to Streamable HTTP spec
     POST: Client-to-server messages
     GET: Server-to-client streaming (SSE)
+    Authentication and session lookup are done by MCPRequestMiddleware
     """
+    handler = _METHOD_DISPATCH.get(request.method)
+    if handler is None:
+        return Response("Method not allowed", status_code=405)
+    return await handler(request, request.state.mcp_session)
 
-    # Verify authentication
-    if not await verify_auth(request):
-        return Response("Unauthorized", status_code=401)
 
-    # Verify MCP protocol version
-    protocol_version = request.headers.get("MCP-Protocol-Version", "2025-03-26")
-    logger.info(f"MCP Protocol Version: {protocol_version}")
+# JSON-RPC internal error response, filled with the serialized id and message
+_ERROR_TEMPLATE = b'{"jsonrpc":"2.0","id":%s,"error":{"code":-32603,"message":%s}}'
 
-    # Get or create session
-    session_id = request.headers.get("Mcp-Session-Id")
-    session = get_or_create_session(session_id)
+# JSON-RPC batching was removed from MCP in this protocol revision
+_BATCH_REMOVED_VERSION = "2025-06-18"
+_BATCH_REJECTED = (
+    b'{"jsonrpc":"2.0","id":null,"error":{"code":-32600,'
+    b'"message":"JSON-RPC batches are not supported in MCP protocol version 2025-06-18 and later"}}'
+)
+
+
+async def read_body(request: Request) -> bytes | bytearray:
+    """
+    Read the request body from the ASGI stream. Single-chunk bodies (most
+    MCP messages) are returned as-is; larger ones are accumulated in a
+    bytearray rather than copied by repeated bytes concatenation.
+    """
+    body = b""
+    buffer = None
+    async for chunk in request.stream():
+        if buffer is not None:
+            buffer.extend(chunk)
+        elif body:
+            buffer = bytearray(body)
+            buffer.extend(chunk)
+        else:
+            body = chunk
+    return body if buffer is None else buffer
+
+
+async def dispatch_message(message: dict, session: Session) -> Optional[bytes]:
+    """
+    Process one JSON-RPC message and return its serialized response,
+    or None for notifications and responses, which get no reply
+    """
+    logger.info("Received message: %s", message.get('method', 'response'))
+
+    # Handle initialization
+    if message.get("method") == "initialize":
+        session.initialized = True
+        return b'{"jsonrpc":"2.0","id":' + orjson.dumps(message.get("id")) + b',"result":' + _INITIALIZE_RESULT + b'}'
+
+    # Handle tools/list
+    if message.get("method") == "tools/list":
+        return b'{"jsonrpc":"2.0","id":' + orjson.dumps(message.get("id")) + b',"result":' + _TOOLS_LIST_RESULT + b'}'
+
+    # Handle tools/call
+    if message.get("method") == "tools/call":
+        params = message.get("params", {})
+        result = await handle_call_tool(params.get("name"), params.get("arguments", {}))
+
+        return orjson.dumps({
+            "jsonrpc": "2.0",
+            "id": message.get("id"),
+            "result": {
+                "content": [
+                    {"type": "text", "text": item.text} if item.type == "text"
+                    else item.model_dump(mode="json", by_alias=True, exclude_none=True)
+                    for item in result
+                ]
+            }
+        })
+
+    return None
 
-    if request.method == "POST":
-        return await handle_post(request, session)
-    elif request.method == "GET":
-        return await handle_get(request, session)
-    else:
-        return Response("Method not allowed", status_code=405)
+
+async def dispatch_batch_message(message: Any, session: Session) -> Optional[bytes]:
+    """Dispatch one entry of a batch, turning failures into a JSON-RPC error entry"""
+    try:
+        return await dispatch_message(message, session)
+    except Exception as e:
+        logger.error("Error handling batch message: %s", e, exc_info=True)
+        request_id = message.get("id") if isinstance(message, dict) else None
+        return _ERROR_TEMPLATE % (orjson.dumps(request_id), orjson.dumps(str(e)))
 
 
 async def handle_post(request: Request, session: Session):
@@ -341,122 +764,87 @@ async def handle_post(request: Request, session: Session):
     - 202 Accepted (for notifications/responses)
     - JSON response (for requests)
     - SSE stream (for requests that need streaming)
+    A JSON-RPC batch (array of messages) from a client on a protocol version
+    before 2025-06-18 is dispatched concurrently and answered with an array
+    of responses; later versions no longer allow batches
     """
+    message = None
     try:
         # Parse JSON-RPC message
-        body = await request.body()
-        message = json.loads(body.decode('utf-8'))
-
-        logger.info(f"Received message: {message.get('method', 'response')}")
-
-        # Handle initialization
-        if message.get("method") == "initialize":
-            # Process initialization through MCP server
-            response = {
-                "jsonrpc": "2.0",
-                "id": message.get("id"),
-                "result": {
-                    "protocolVersion": MCP_PROTOCOL_VERSION,
-                    "capabilities": {
-                        "tools": {},
-                    },
-                    "serverInfo": {
-                        "name": "trustydata-mcp",
-                        "version": "1.0.0",
-                        "icons": [
-                            {
-                                "src": "https://mcp.trustydata.app/favicon.ico",
-                                "mimeType": "image/x-icon"
-                            }
-                        ]
-                    }
-                }
-            }
-
-            session.initialized = True
-
-            # Return JSON response with session ID header
-            return JSONResponse(
-                response,
-                headers={
-                    "Mcp-Session-Id": session.session_id,
-                    "Content-Type": "application/json"
-                }
+        body = await read_body(request)
+        message = orjson.loads(body)
+
+        if isinstance(message, list):
+            if request.state.protocol_version >= _BATCH_REMOVED_VERSION:
+                return Response(
+                    _BATCH_REJECTED,
+                    status_code=400,
+                    media_type="application/json",
+                    headers={"Mcp-Session-Id": session.session_id}
+                )
+            if not message:
+                raise ValueError("Empty JSON-RPC batch")
+            # Each entry fails on its own, so one error does not cancel the others
+            results = await asyncio.gather(
+                *(dispatch_batch_message(m, session) for m in message)
             )
-
-        # Handle tools/list
-        if message.get("method") == "tools/list":
-            tools = await handle_list_tools()
-            response = {
-                "jsonrpc": "2.0",
-                "id": message.get("id"),
-                "result": {
-                    "tools": [
-                        {
-                            "name": tool.name,
-                            "description": tool.description,
-                            "inputSchema": tool.inputSchema
-                        }
-                        for tool in tools
-                    ]
-                }
-            }
-
-            return JSONResponse(
-                response,
-                headers={
-                    "Mcp-Session-Id": session.session_id,
-                    "Content-Type": "application/json"
-                }
+            responses = [r for r in results if r is not None]
+            if not responses:
+                return Response(
+                    status_code=202,
+                    headers={"Mcp-Session-Id": session.session_id}
+                )
+            return Response(
+                b"[" + b",".join(responses) + b"]",
+                media_type="application/json",
+                headers={"Mcp-Session-Id": session.session_id}
             )
 
-        # Handle tools/call
+        # Stream large locality searches to clients that accept SSE
         if message.get("method") == "tools/call":
             params = message.get("params", {})
-            tool_name = params.get("name")
             arguments = params.get("arguments", {})
+            if (
+                params.get("name") == "search_localities"
+                and TRUSTYDATA_API_KEY
+                and not (arguments or {}).get("raw_json")
+                and "text/event-stream" in request.headers.get("Accept", "")
+            ):
+                logger.info("Received message: tools/call (streamed)")
+                return StreamingResponse(
+                    stream_search_localities(message.get("id"), arguments),
+                    media_type="text/event-stream",
+                    headers={
+                        "Mcp-Session-Id": session.session_id,
+                        "Cache-Control": "no-cache",
+                        "X-Accel-Buffering": "no",
+                    }
+                )
 
-            result = await handle_call_tool(tool_name, arguments)
-
-            response = {
-                "jsonrpc": "2.0",
-                "id": message.get("id"),
-                "result": {
-                    "content": [
-                        {
-                            "type": item.type,
-                            "text": item.text if hasattr(item, 'text') else ""
-                        }
-                        for item in result
-                    ]
-                }
-            }
+        content = await dispatch_message(message, session)
 
-            return JSONResponse(
-                response,
-                headers={
-                    "Mcp-Session-Id": session.session_id,
-                    "Content-Type": "application/json"
-                }
+        # For other messages, return 202 Accepted
+        if content is None:
+            return Response(
+                status_code=202,
+                headers={"Mcp-Session-Id": session.session_id}
             )
 
-        # For other messages, return 202 Accepted
+        # Return JSON response with session ID header
         return Response(
-            status_code=202,
+            content,
+            media_type="application/json",
             headers={"Mcp-Session-Id": session.session_id}
         )
 
     except Exception as e:
-        logger.error(f"Error handling POST: {str(e)}", exc_info=True)
-        error_response = {
-            "jsonrpc": "2.0",
-            "id": message.get("id") if 'message' in locals() else None,
-            "error": {
-                "code": -32603,
-                "message": str(e)
-            }
-        }
-        return JSONResponse(error_response, status_code=500)
+        logger.error("Error handling POST: %s", e, exc_info=True)
+        request_id = message.get("id") if isinstance(message, dict) else None
+        return Response(
+            _ERROR_TEMPLATE % (orjson.dumps(request_id), orjson.dumps(str(e))),
+            status_code=500,
+            media_type="application/json"
+        )
 
 
 async def handle_get(request: Request, session: Session):
@@ -474,15 +862,19 @@ async def handle_get(request: Request, session: Session):
     return Response("Method Not Allowed - Server does not support SSE streaming", status_code=405)
 
 
+# HTTP method -> handler for the /mcp endpoint
+_METHOD_DISPATCH = {
+    "POST": handle_post,
+    "GET": handle_get,
+}
+
+
 async def handle_delete(request: Request):
     """Handle DELETE requests - session termination"""
-    if not await verify_auth(request):
-        return Response("Unauthorized", status_code=401)
-
     session_id = request.headers.get("Mcp-Session-Id")
     if session_id and session_id in sessions:
         del sessions[session_id]
-        logger.info(f"Deleted session: {session_id}")
+        logger.info("Deleted session: %s", session_id)
         return Response(status_code=204)
 
     return Response("Session not found", status_code=404)
@@ -490,7 +882,7 @@ async def handle_delete(request: Request):
 
 async def health_check(request: Request):
     """Health check endpoint"""
-    return JSONResponse({
+    return ORJSONResponse({
         "status": "healthy",
         "service": "trustydata-mcp",
         "version": "1.0.0",
@@ -499,9 +891,19 @@ async def health_check(request: Request):
     })
 
 
+@asynccontextmanager
+async def lifespan(app: Starlette):
+    """Application lifespan - session reaper and upstream connection pool"""
+    reaper = asyncio.create_task(reap_sessions())
+    yield
+    reaper.cancel()
+    await HTTP_CLIENT.aclose()
+
+
 # Create Starlette app with CORS
 app = Starlette(
-    debug=True,
+    debug=DEBUG,
+    lifespan=lifespan,
     routes=[
         Route("/mcp", endpoint=handle_mcp_endpoint, methods=["GET", "POST"]),
         Route("/mcp", endpoint=handle_delete, methods=["DELETE"]),
@@ -513,8 +915,17 @@ app = Starlette(
             allow_origins=["*"],  # Configure appropriately for production
             allow_credentials=True,
             allow_methods=["GET", "POST", "DELETE", "OPTIONS"],
-            allow_headers=["*"],
-        )
+            allow_headers=[
+                "Authorization",
+                "Content-Type",
+                "Accept",
+                "MCP-Protocol-Version",
+                "Mcp-Session-Id",
+            ],
+        ),
+        # Large tool results are highly repetitive text; SSE streams are left uncompressed
+        Middleware(GZipMiddleware, minimum_size=1024),
+        Middleware(MCPRequestMiddleware),
     ]
 )
 
@@ -523,14 +934,43 @@ if __name__ == "__main__":
     port = int(os.getenv("PORT", "8500"))
     host = os.getenv("HOST", "127.0.0.1")
 
-    logger.info(f"Starting TrustyData Remote MCP Server")
-    logger.info(f"Protocol Version: {MCP_PROTOCOL_VERSION}")
-    logger.info(f"Listening on {host}:{port}")
-    logger.info(f"MCP Endpoint: http://{host}:{port}/mcp")
-    logger.info(f"API TrustyData Base URL: {API_BASE_URL}")
+    logger.info("Starting TrustyData Remote MCP Server")
+    logger.info("Protocol Version: %s", MCP_PROTOCOL_VERSION)
+    logger.info("Listening on %s:%s", host, port)
+    logger.info("MCP Endpoint: http://%s:%s/mcp", host, port)
+    logger.info("API TrustyData Base URL: %s", API_BASE_URL)
 
     if not SERVER_AUTH_TOKEN:
         logger.warning("⚠️  WARNING: Running without authentication!")
         logger.warning("⚠️  Set SERVER_AUTH_TOKEN environment variable for production")
 
-    uvicorn.run(app, host=host, port=port, log_level="info")
+    # With WORKERS > 1 (or "auto" for one per CPU), hand over to Gunicorn
+    # running Uvicorn workers. Each worker keeps its own sessions, result
+    # cache and upstream connection pool; unknown Mcp-Session-Id values are
+    # recreated on demand, so clients do not need worker affinity.
+    workers_env = os.getenv("WORKERS", "0")
+    workers = (os.cpu_count() or 1) if workers_env == "auto" else int(workers_env)
+    if workers > 1:
+        logger.info("Starting %d Gunicorn workers", workers)
+        # Through the running interpreter, so a venv not on PATH still works
+        os.execv(sys.executable, [
+            sys.executable, "-m", "gunicorn",
+            "server_remote:app",
+            "--chdir", os.path.dirname(os.path.abspath(__file__)),
+            "--worker-class", "uvicorn_worker.UvicornWorker",
+            "--workers", str(workers),
+            "--bind", f"{host}:{port}",
+            "--log-level", "warning",
+        ])
+
+    # uvloop event loop and httptools parser come with uvicorn[standard];
+    # per-request access logging is disabled as it dominates CPU per request.
+    uvicorn.run(
+        app,
+        host=host,
+        port=port,
+        log_level="warning",
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+    )
@@ -26,12 +26,9 @@ fi
 # Activate virtual environment
 source venv/bin/activate
 
-# Check if required packages are installed
+# Install or update dependencies (no-op when everything is already satisfied)
 echo -e "${YELLOW}Checking dependencies...${NC}"
-if ! python -c "import starlette" 2>/dev/null; then
-    echo -e "${YELLOW}Installing dependencies...${NC}"
-    pip install -r requirements.txt
-fi
+pip install -q -r requirements.txt
 
 # Load environment variables from .env if it exists
 if [ -f .env ]; then
@@ -4,16 +4,88 @@ Tests the Streamable HTTP protocol implementation
 """
 
 import os
+import re
 import sys
-import json
+import asyncio
 import httpx
+import ijson
+import orjson
 from typing import Optional
 
+# Run as a script - test_remote_server_pytest.py wraps these checks for pytest
+__test__ = False
+
 # Configuration
 BASE_URL = os.getenv("MCP_SERVER_URL", "http://127.0.0.1:8500")
 AUTH_TOKEN = os.getenv("SERVER_AUTH_TOKEN", "")
+MAX_CONCURRENT = int(os.getenv("MCP_TEST_MAX_CONCURRENT", "4"))  # Parallel requests in detailed tests
+
+# Headers sent with every request, Authorization formatted once
+_DEFAULT_HEADERS = {
+    "Content-Type": "application/json",
+    "MCP-Protocol-Version": "2025-06-18",
+    "Accept": "application/json",
+}
+
+if AUTH_TOKEN:
+    _DEFAULT_HEADERS["Authorization"] = f"Bearer {AUTH_TOKEN}"
+
+# Tool calls let the server stream its answer over SSE
+_STREAM_ACCEPT = "application/json, text/event-stream"
+
+# Static JSON-RPC request bodies, serialized once
+_INITIALIZE_BODY = orjson.dumps({
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2025-06-18",
+        "capabilities": {},
+        "clientInfo": {
+            "name": "test-client",
+            "version": "1.0.0"
+        }
+    }
+})
+
+_LIST_TOOLS_BODY = orjson.dumps({
+    "jsonrpc": "2.0",
+    "id": 2,
+    "method": "tools/list"
+})
+
+_CALL_TOOL_BODY = orjson.dumps({
+    "jsonrpc": "2.0",
+    "id": 3,
+    "method": "tools/call",
+    "params": {
+        "name": "search_localities",
+        "arguments": {
+            "q": "Paris",
+            "limit": 3,
+            "raw_json": False  # Explicit default: must not be forwarded to the API
+        }
+    }
+})
+
+_AUTH_TEST_BODY = orjson.dumps({
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {"protocolVersion": "2025-06-18"}
+})
+
+# Tool results reporting a failed search (API error, bad arguments, missing key)
+_TOOL_ERROR_PREFIXES = ("API Error", "Error")
 
-# Colors for terminal output
+# Result count in the tool output: "Found X localities:" or "Found X locality:"
+_FOUND_RE = re.compile(r'Found (\d+) localit(?:y|ies)')
+
+# Start of the tool result text value, and the longest run of complete JSON string characters
+_TEXT_KEY_RE = re.compile(rb'"text"\s*:\s*"')
+_JSON_STRING_BODY_RE = re.compile(rb'(?:[^"\\]|\\u[0-9a-fA-F]{4}|\\[^u])*')
+
+# Colors for terminal output (disabled when stdout is redirected)
 class Colors:
     GREEN = '\033[92m'
     YELLOW = '\033[93m'
@@ -23,224 +95,238 @@ class Colors:
     END = '\033[0m'
 
 
+if not sys.stdout.isatty():
+    for _name in ("GREEN", "YELLOW", "RED", "BLUE", "BOLD", "END"):
+        setattr(Colors, _name, "")
+
+# Line prefixes/suffix for the print helpers, built once
+_TEST_PREFIX = f"\n{Colors.BOLD}{Colors.BLUE}→ "
+_SUCCESS_PREFIX = f"  {Colors.GREEN}✓ "
+_ERROR_PREFIX = f"  {Colors.RED}✗ "
+_WARNING_PREFIX = f"  {Colors.YELLOW}⚠ "
+_END_NL = f"{Colors.END}\n"
+
+
+def _is_sse(response: httpx.Response) -> bool:
+    """Whether the server answered with a text/event-stream body"""
+    return response.headers.get("Content-Type", "").startswith("text/event-stream")
+
+
+def _json(response: httpx.Response):
+    """Decode a JSON response body with orjson (the first data: message of an SSE body)"""
+    if _is_sse(response):
+        for line in response.content.splitlines():
+            if line.startswith(b"data:"):
+                return orjson.loads(line[5:])
+        return None
+    return orjson.loads(response.content)
+
+
+async def stream_text(response: httpx.Response) -> Optional[str]:
+    """Incrementally parse a streamed JSON-RPC response, returning result.content[0].text as soon as it is complete"""
+    if _is_sse(response):
+        # Each data: line carries one complete JSON-RPC message
+        async for line in response.aiter_lines():
+            if line.startswith("data:"):
+                content = (orjson.loads(line[5:]).get("result") or {}).get("content") or [{}]
+                return content[0].get("text")
+        return None
+
+    items = ijson.sendable_list()
+    parser = ijson.items_coro(items, 'result.content.item.text')
+    async for chunk in response.aiter_bytes():
+        parser.send(chunk)
+        if items:
+            return items[0]
+    parser.close()
+    return items[0] if items else None
+
+
+async def stream_preview(response: httpx.Response, limit: int = 200) -> Optional[str]:
+    """Preview the first `limit` characters of result.content[0].text, reading and decoding only that much
+
+    Works on the raw bytes, so the same scan covers JSON and SSE (data: line) responses.
+    """
+    budget = (limit + 1) * 6  # one character past the limit, at up to 6 escaped bytes (\uXXXX) each
+    buffer = b""
+    start = None
+
+    async for chunk in response.aiter_bytes():
+        buffer += chunk
+        if start is None:
+            match = _TEXT_KEY_RE.search(buffer)
+            if match is None:
+                continue
+            start = match.end()
+
+        # Stop once the string is closed or enough of it has arrived
+        end = _JSON_STRING_BODY_RE.match(buffer, start, min(len(buffer), start + budget)).end()
+        closed = buffer[end:end + 1] == b'"'
+        if closed or len(buffer) >= start + budget:
+            break
+
+    if start is None:
+        return None
+
+    # A cut may split a UTF-8 sequence: drop it before unescaping
+    text = orjson.loads('"' + buffer[start:end].decode('utf-8', 'ignore') + '"')
+    return text[:limit] + '...' if not closed or len(text) > limit else text
+
+
 def print_test(name: str):
     """Print test name"""
-    print(f"\n{Colors.BOLD}{Colors.BLUE}→ {name}{Colors.END}")
+    sys.stdout.write(_TEST_PREFIX)
+    sys.stdout.write(name)
+    sys.stdout.write(_END_NL)
 
 
 def print_success(msg: str):
     """Print success message"""
-    print(f"  {Colors.GREEN}✓ {msg}{Colors.END}")
+    sys.stdout.write(_SUCCESS_PREFIX)
+    sys.stdout.write(msg)
+    sys.stdout.write(_END_NL)
 
 
 def print_error(msg: str):
     """Print error message"""
-    print(f"  {Colors.RED}✗ {msg}{Colors.END}")
+    sys.stdout.write(_ERROR_PREFIX)
+    sys.stdout.write(msg)
+    sys.stdout.write(_END_NL)
 
 
 def print_warning(msg: str):
     """Print warning message"""
-    print(f"  {Colors.YELLOW}⚠ {msg}{Colors.END}")
+    sys.stdout.write(_WARNING_PREFIX)
+    sys.stdout.write(msg)
+    sys.stdout.write(_END_NL)
 
 
-async def test_health_check():
+async def test_health_check(client: httpx.AsyncClient):
     """Test health check endpoint"""
     print_test("Testing health check endpoint")
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(f"{BASE_URL}/health")
-
-            if response.status_code == 200:
-                data = response.json()
-                print_success(f"Health check passed")
-                print(f"    Status: {data.get('status')}")
-                print(f"    Service: {data.get('service')}")
-                print(f"    Version: {data.get('version')}")
-                print(f"    Protocol: {data.get('protocol_version')}")
-                return True
-            else:
-                print_error(f"Health check failed: {response.status_code}")
-                return False
-        except Exception as e:
-            print_error(f"Health check failed: {str(e)}")
+    try:
+        response = await client.get("/health")
+
+        if response.status_code == 200:
+            data = _json(response)
+            print_success(f"Health check passed")
+            print(f"    Status: {data.get('status')}")
+            print(f"    Service: {data.get('service')}")
+            print(f"    Version: {data.get('version')}")
+            print(f"    Protocol: {data.get('protocol_version')}")
+            print(f"    HTTP version: {response.http_version}")
+            return True
+        else:
+            print_error(f"Health check failed: {response.status_code}")
             return False
+    except Exception as e:
+        print_error(f"Health check failed: {e}")
+        return False
 
 
-async def test_initialize(session_id: Optional[str] = None) -> Optional[str]:
+async def test_initialize(client: httpx.AsyncClient, session_id: Optional[str] = None) -> Optional[str]:
     """Test MCP initialize request"""
     print_test("Testing MCP initialize")
 
-    headers = {
-        "Content-Type": "application/json",
-        "MCP-Protocol-Version": "2025-06-18",
-        "Accept": "application/json",
-    }
-
-    if AUTH_TOKEN:
-        headers["Authorization"] = f"Bearer {AUTH_TOKEN}"
-
-    if session_id:
-        headers["Mcp-Session-Id"] = session_id
-
-    payload = {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "initialize",
-        "params": {
-            "protocolVersion": "2025-06-18",
-            "capabilities": {},
-            "clientInfo": {
-                "name": "test-client",
-                "version": "1.0.0"
-            }
-        }
-    }
-
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(
-                f"{BASE_URL}/mcp",
-                headers=headers,
-                json=payload
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                new_session_id = response.headers.get("Mcp-Session-Id")
-
-                print_success("Initialize successful")
-                print(f"    Session ID: {new_session_id}")
-                print(f"    Protocol: {data.get('result', {}).get('protocolVersion')}")
-                print(f"    Server: {data.get('result', {}).get('serverInfo', {}).get('name')}")
-
-                return new_session_id
-            else:
-                print_error(f"Initialize failed: {response.status_code}")
-                print(f"    Response: {response.text}")
-                return None
-        except Exception as e:
-            print_error(f"Initialize failed: {str(e)}")
+    headers = {"Mcp-Session-Id": session_id} if session_id else None
+
+    try:
+        response = await client.post(
+            "/mcp",
+            headers=headers,
+            content=_INITIALIZE_BODY
+        )
+
+        if response.status_code == 200:
+            data = _json(response)
+            new_session_id = response.headers.get("Mcp-Session-Id")
+
+            print_success("Initialize successful")
+            print(f"    Session ID: {new_session_id}")
+            result = data.get('result') or {}
+            print(f"    Protocol: {result.get('protocolVersion')}")
+            print(f"    Server: {(result.get('serverInfo') or {}).get('name')}")
+
+            return new_session_id
+        else:
+            print_error(f"Initialize failed: {response.status_code}")
+            print(f"    Response: {response.text}")
             return None
+    except Exception as e:
+        print_error(f"Initialize failed: {e}")
+        return None
 
 
-async def test_list_tools(session_id: str):
+async def test_list_tools(client: httpx.AsyncClient, session_id: str):
     """Test tools/list request"""
     print_test("Testing tools/list")
 
-    headers = {
-        "Content-Type": "application/json",
-        "MCP-Protocol-Version": "2025-06-18",
-        "Mcp-Session-Id": session_id,
-        "Accept": "application/json",
-    }
-
-    if AUTH_TOKEN:
-        headers["Authorization"] = f"Bearer {AUTH_TOKEN}"
+    headers = {"Mcp-Session-Id": session_id}
 
-    payload = {
-        "jsonrpc": "2.0",
-        "id": 2,
-        "method": "tools/list"
-    }
-
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(
-                f"{BASE_URL}/mcp",
-                headers=headers,
-                json=payload
-            )
+    try:
+        response = await client.post(
+            "/mcp",
+            headers=headers,
+            content=_LIST_TOOLS_BODY
+        )
 
-            if response.status_code == 200:
-                data = response.json()
-                tools = data.get('result', {}).get('tools', [])
+        if response.status_code == 200:
+            data = _json(response)
+            tools = (data.get('result') or {}).get('tools') or []
 
-                print_success(f"Found {len(tools)} tool(s)")
-                for tool in tools:
-                    print(f"    - {tool.get('name')}: {tool.get('description')[:60]}...")
+            print_success(f"Found {len(tools)} tool(s)")
+            for tool in tools:
+                print(f"    - {tool.get('name')}: {tool.get('description')[:60]}...")
 
-                return True
-            else:
-                print_error(f"List tools failed: {response.status_code}")
-                print(f"    Response: {response.text}")
-                return False
-        except Exception as e:
-            print_error(f"List tools failed: {str(e)}")
+            return True
+        else:
+            print_error(f"List tools failed: {response.status_code}")
+            print(f"    Response: {response.text}")
             return False
+    except Exception as e:
+        print_error(f"List tools failed: {e}")
+        return False
 
 
-async def test_call_tool(session_id: str):
+async def test_call_tool(client: httpx.AsyncClient, session_id: str):
     """Test tools/call request"""
     print_test("Testing tools/call - search_localities")
 
-    headers = {
-        "Content-Type": "application/json",
-        "MCP-Protocol-Version": "2025-06-18",
-        "Mcp-Session-Id": session_id,
-        "Accept": "application/json",
-    }
+    headers = {"Mcp-Session-Id": session_id, "Accept": _STREAM_ACCEPT}
 
-    if AUTH_TOKEN:
-        headers["Authorization"] = f"Bearer {AUTH_TOKEN}"
-
-    payload = {
-        "jsonrpc": "2.0",
-        "id": 3,
-        "method": "tools/call",
-        "params": {
-            "name": "search_localities",
-            "arguments": {
-                "q": "Paris",
-                "limit": 3
-            }
-        }
-    }
-
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                f"{BASE_URL}/mcp",
-                headers=headers,
-                json=payload
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                result = data.get('result', {})
-                content = result.get('content', [])
-
-                print_success("Tool call successful")
-
-                if content:
-                    text = content[0].get('text', '')
-                    # Show first 200 chars
-                    preview = text[:200] + '...' if len(text) > 200 else text
-                    print(f"    Result preview:\n    {preview}")
-
-                return True
-            else:
+    try:
+        async with client.stream("POST", "/mcp", headers=headers, content=_CALL_TOOL_BODY) as response:
+            if response.status_code != 200:
+                await response.aread()
                 print_error(f"Tool call failed: {response.status_code}")
                 print(f"    Response: {response.text}")
                 return False
-        except Exception as e:
-            print_error(f"Tool call failed: {str(e)}")
+
+            # Show first 200 chars - stops reading once they have arrived
+            preview = await stream_preview(response)
+
+        if preview is not None and preview.startswith(_TOOL_ERROR_PREFIXES):
+            print_error("Tool call returned an error")
+            print(f"    Result: {preview}")
             return False
 
+        print_success("Tool call successful")
+
+        if preview is not None:
+            print(f"    Result preview:\n    {preview}")
+
+        return True
+    except Exception as e:
+        print_error(f"Tool call failed: {e}")
+        return False
+
 
-async def test_search_localities_detailed(session_id: str):
+async def test_search_localities_detailed(client: httpx.AsyncClient, session_id: str):
     """Test search_localities with various filters and scenarios"""
     print_test("Testing search_localities - Detailed Tests")
 
-    headers = {
-        "Content-Type": "application/json",
-        "MCP-Protocol-Version": "2025-06-18",
-        "Mcp-Session-Id": session_id,
-        "Accept": "application/json",
-    }
-
-    if AUTH_TOKEN:
-        headers["Authorization"] = f"Bearer {AUTH_TOKEN}"
+    headers = {"Mcp-Session-Id": session_id, "Accept": _STREAM_ACCEPT}
 
     test_cases = [
         {
@@ -283,6 +369,14 @@ async def test_search_localities_detailed(session_id: str):
                 "limit": 5
             }
         },
+        {
+            "name": "Search with raw_json disabled",
+            "arguments": {
+                "q": "Marseille",
+                "raw_json": False,
+                "limit": 5
+            }
+        },
         {
             "name": "Search with no results",
             "arguments": {
@@ -292,12 +386,11 @@ async def test_search_localities_detailed(session_id: str):
         }
     ]
 
-    all_passed = True
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT)
 
-    for idx, test_case in enumerate(test_cases, 1):
-        print(f"\n  Test {idx}: {test_case['name']}")
-
-        payload = {
+    # Serialize every payload up front, outside the request path
+    bodies = [
+        orjson.dumps({
             "jsonrpc": "2.0",
             "id": 100 + idx,
             "method": "tools/call",
@@ -305,56 +398,82 @@ async def test_search_localities_detailed(session_id: str):
                 "name": "search_localities",
                 "arguments": test_case["arguments"]
             }
-        }
+        })
+        for idx, test_case in enumerate(test_cases, 1)
+    ]
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            try:
-                response = await client.post(
-                    f"{BASE_URL}/mcp",
-                    headers=headers,
-                    json=payload
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    result = data.get('result', {})
-                    content = result.get('content', [])
-
-                    if content:
-                        text = content[0].get('text', '')
-                        
-                        # Extract number of results from response
-                        if "No localities found" in text:
-                            count = 0
-                        else:
-                            # Try to extract count from "Found X localities:" or "Found X locality:"
-                            import re
-                            match = re.search(r'Found (\d+) localit(?:y|ies)', text)
-                            count = int(match.group(1)) if match else 0
-
-                        print_success(f"Query succeeded - Found {count} result(s)")
-                        
-                        # Show a snippet of the result
-                        lines = text.split('\n')[:5]
-                        for line in lines:
-                            if line.strip():
-                                print(f"      {line[:70]}")
+    # Set on the first 5xx so queued cases are skipped instead of hitting a broken server
+    server_error = asyncio.Event()
+
+    async def post_case(body: bytes) -> tuple[int, Optional[str]]:
+        """Return (status, text) - text is the tool result on 200, the error body otherwise"""
+        async with semaphore:
+            if server_error.is_set():
+                raise RuntimeError("Skipped after an earlier server error")
+
+            async with client.stream("POST", "/mcp", headers=headers, content=body) as response:
+                if response.status_code != 200:
+                    if response.status_code >= 500:
+                        server_error.set()
+                    await response.aread()
+                    return response.status_code, response.text
+                return response.status_code, await stream_text(response)
+
+    # Cases are independent: send them concurrently, then report in order.
+    # Single calls, as MCP 2025-06-18 no longer allows JSON-RPC batches
+    responses = await asyncio.gather(
+        *(post_case(body) for body in bodies),
+        return_exceptions=True
+    )
+
+    all_passed = True
+
+    for idx, (test_case, response) in enumerate(zip(test_cases, responses), 1):
+        print(f"\n  Test {idx}: {test_case['name']}")
+
+        try:
+            if isinstance(response, Exception):
+                raise response
+
+            status, text = response
+
+            if status == 200:
+                if text is not None and text.startswith(_TOOL_ERROR_PREFIXES):
+                    print_error("Tool returned an error")
+                    print(f"      {text[:100]}")
+                    all_passed = False
+                elif text is not None:
+
+                    # Extract number of results from response
+                    if "No localities found" in text:
+                        count = 0
                     else:
-                        print_warning("No content in response")
-                        all_passed = False
+                        match = _FOUND_RE.search(text)
+                        count = int(match.group(1)) if match else 0
+
+                    print_success(f"Query succeeded - Found {count} result(s)")
+
+                    # Show a snippet of the result
+                    lines = text.split('\n')[:5]
+                    for line in lines:
+                        if line.strip():
+                            print(f"      {line[:70]}")
                 else:
-                    print_error(f"Request failed: {response.status_code}")
-                    print(f"      Response: {response.text[:100]}")
+                    print_warning("No content in response")
                     all_passed = False
-
-            except Exception as e:
-                print_error(f"Exception: {str(e)}")
+            else:
+                print_error(f"Request failed: {status}")
+                print(f"      Response: {text[:100]}")
                 all_passed = False
 
+        except Exception as e:
+            print_error(f"Exception: {e}")
+            all_passed = False
+
     return all_passed
 
 
-async def test_authentication():
+async def test_authentication(client: httpx.AsyncClient):
     """Test authentication"""
     print_test("Testing authentication")
 
@@ -362,36 +481,58 @@ async def test_authentication():
         print_warning("No AUTH_TOKEN set - skipping authentication test")
         return True
 
-    # Try without token
-    headers = {
-        "Content-Type": "application/json",
-        "MCP-Protocol-Version": "2025-06-18",
-    }
+    # Try without token - the shared client sends it by default, so drop it
+    try:
+        request = client.build_request("POST", "/mcp", content=_AUTH_TEST_BODY)
+        del request.headers["Authorization"]
+        response = await client.send(request)
+
+        if response.status_code == 401:
+            print_success("Authentication required (as expected)")
+            return True
+        else:
+            print_warning(f"Expected 401, got {response.status_code}")
+            return False
+    except Exception as e:
+        print_error(f"Authentication test failed: {e}")
+        return False
+
+
+def create_client(base_url: str = BASE_URL) -> httpx.AsyncClient:
+    """Create the pooled client the tests share"""
+    # One pooled client for the whole run, so connections are reused across tests.
+    # HTTP/2 is negotiated when the server supports it (falls back to HTTP/1.1).
+    # Pool settings live on the transport: the client ignores its own when one is given
+    return httpx.AsyncClient(
+        base_url=base_url,
+        headers=_DEFAULT_HEADERS,
+        timeout=httpx.Timeout(60.0, connect=5.0),
+        transport=httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=0,  # No silent retries skewing timings
+            limits=httpx.Limits(max_connections=8, max_keepalive_connections=8, keepalive_expiry=30.0),
+        ),
+    )
+
+
+async def run_tests(client: httpx.AsyncClient) -> list[tuple[str, bool]]:
+    """Run every test against the server behind `client`, returning (name, passed) pairs"""
+    results = []
 
-    payload = {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "initialize",
-        "params": {"protocolVersion": "2025-06-18"}
-    }
+    # Sequential: both are cheap, and running them together interleaves their output
+    results.append(("Health Check", await test_health_check(client)))
+    if AUTH_TOKEN:
+        results.append(("Authentication", await test_authentication(client)))
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(
-                f"{BASE_URL}/mcp",
-                headers=headers,
-                json=payload
-            )
-
-            if response.status_code == 401:
-                print_success("Authentication required (as expected)")
-                return True
-            else:
-                print_warning(f"Expected 401, got {response.status_code}")
-                return False
-        except Exception as e:
-            print_error(f"Authentication test failed: {str(e)}")
-            return False
+    session_id = await test_initialize(client)
+    results.append(("Initialize", session_id is not None))
+
+    if session_id:
+        results.append(("List Tools", await test_list_tools(client, session_id)))
+        results.append(("Call Tool", await test_call_tool(client, session_id)))
+        results.append(("Search Localities Detailed", await test_search_localities_detailed(client, session_id)))
+
+    return results
 
 
 async def main():
@@ -406,21 +547,8 @@ async def main():
         print("Auth Token: Not set")
     print("")
 
-    results = []
-
-    # Run tests
-    results.append(("Health Check", await test_health_check()))
-
-    if AUTH_TOKEN:
-        results.append(("Authentication", await test_authentication()))
-
-    session_id = await test_initialize()
-    results.append(("Initialize", session_id is not None))
-
-    if session_id:
-        results.append(("List Tools", await test_list_tools(session_id)))
-        results.append(("Call Tool", await test_call_tool(session_id)))
-        results.append(("Search Localities Detailed", await test_search_localities_detailed(session_id)))
+    async with create_client() as client:
+        results = await run_tests(client)
 
     # Summary
     print(f"\n{Colors.BOLD}═══════════════════════════════════════════════════{Colors.END}")
@@ -446,5 +574,12 @@ async def main():
 
 
 if __name__ == "__main__":
-    import asyncio
-    sys.exit(asyncio.run(main()))
+    # uvloop (installed with uvicorn[standard]) when available, stdlib loop otherwise
+    try:
+        import uvloop
+    except ImportError:
+        run = asyncio.run
+    else:
+        run = uvloop.run
+
+    sys.exit(run(main()))
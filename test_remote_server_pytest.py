@@ -0,0 +1,52 @@
+"""
+Pytest wrappers for the TrustyData MCP Remote Server test suite
+Runs the checks from test_remote_server.py against MCP_SERVER_URL
+(requires pytest-asyncio >= 0.24 for loop_scope: pip install -r requirements-dev.txt)
+"""
+
+import httpx
+import pytest
+import pytest_asyncio
+
+import test_remote_server as suite
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    """Shared pooled client - skips the module when the server is unreachable"""
+    async with suite.create_client() as client:
+        try:
+            await client.get("/health")
+        except httpx.TransportError as e:
+            pytest.skip(f"MCP server not reachable at {suite.BASE_URL}: {e}")
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def session_id(client):
+    """MCP session opened once for the session-bound tests"""
+    session_id = await suite.test_initialize(client)
+    assert session_id is not None, "initialize did not return a session id"
+    return session_id
+
+
+async def test_health_check(client):
+    assert await suite.test_health_check(client)
+
+
+async def test_authentication(client):
+    assert await suite.test_authentication(client)
+
+
+async def test_list_tools(client, session_id):
+    assert await suite.test_list_tools(client, session_id)
+
+
+async def test_call_tool(client, session_id):
+    assert await suite.test_call_tool(client, session_id)
+
+
+async def test_search_localities_detailed(client, session_id):
+    assert await suite.test_search_localities_detailed(client, session_id)